@@ -1,6 +1,197 @@
 # analyzer.py
+from bisect import bisect_right
 from collections import Counter
+from functools import cached_property
+import importlib.util
 import os
+import re
+
+# Optional NumPy acceleration for the mood distribution matrix
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Numba-compiled kernels (require NumPy). numba is found without
+# importing it; analyzer_jit is imported by _jit() the first time a journal
+# is large enough to use it, so startup does not pay for numba.
+NUMBA_AVAILABLE = NUMPY_AVAILABLE and importlib.util.find_spec("numba") is not None
+_JIT = None
+
+# Applied to lowercased text. Captures runs of 3+ letters; contractions and
+# possessives ("won't", "mom's", with a straight or curly apostrophe) match
+# as a whole with an empty capture, so they are skipped rather than leaving
+# stems such as "won" behind.
+_TOKEN_RE = re.compile(r"[a-z]+(?:['\u2019][a-z]+)+|([a-z]{3,})")
+
+# Lower bounds of the Negative, Neutral, Positive and Very Positive categories,
+# shared with the UI and the visualizer
+MOOD_THRESHOLDS = (-0.5, -0.1, 0.1, 0.5)
+
+# Journals with less text than this are tokenized with the regex; below it
+# the compiled kernel's buffer setup costs more than it saves
+_JIT_MIN_CHARS = 200_000
+
+# Fewer scores than this use the NumPy mood matrix; loading the compiled
+# kernel costs more than it saves until the journal is very large
+_JIT_MIN_SCORES = 200_000
+
+# Stop word set -> sorted FNV-1a hashes of its words, built on first kernel use
+_STOP_HASHES = {}
+
+# Set once the VADER lexicon has been found and loaded successfully
+_VADER_CHECKED = False
+
+# Common stop words to filter out of theme detection
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'under', 'again', 'further',
+    'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all',
+    'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 's',
+    't', 'can', 'will', 'just', 'don', 'should', 'now', 'was', 'were',
+    'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did',
+    'doing', 'am', 'is', 'are', 'be', 'as', 'i', 'me', 'my', 'myself',
+    'we', 'our', 'ours', 'ourselves', 'you', 'your', 'yours', 'yourself',
+    'yourselves', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers',
+    'herself', 'it', 'its', 'itself', 'they', 'them', 'their', 'theirs',
+    'themselves', 'what', 'which', 'who', 'whom', 'this', 'that', 'these',
+    'those', 'if', 'because', 'while', 'out', 'off', 'over', 'down'
+})
+
+
+def _jit():
+    """Returns the analyzer_jit module, imported on first use, or None if numba is unusable."""
+    global _JIT, NUMBA_AVAILABLE
+    if _JIT is None and NUMBA_AVAILABLE:
+        try:
+            import analyzer_jit
+
+            _JIT = analyzer_jit
+        except ImportError:
+            NUMBA_AVAILABLE = False
+    return _JIT
+
+
+def mood_category(score):
+    """
+    Categorizes a mood score into one of 5 categories.
+
+    Returns category index: 0=Very Positive, 1=Positive, 2=Neutral,
+                            3=Negative, 4=Very Negative
+    """
+    return 4 - bisect_right(MOOD_THRESHOLDS, score)
+
+
+def count_moods(dreams):
+    """Counts scored dreams per mood category, ordered Very Positive .. Very Negative."""
+    if NUMPY_AVAILABLE:
+        scores = np.fromiter((d.mood_score for d in dreams if d.mood_score is not None),
+                             dtype=np.float64)
+        # digitize gives 0=Very Negative .. 4=Very Positive; reverse for category order
+        return np.bincount(np.digitize(scores, MOOD_THRESHOLDS), minlength=5)[::-1].tolist()
+
+    counts = [0] * 5
+    for dream in dreams:
+        if dream.mood_score is not None:
+            counts[mood_category(dream.mood_score)] += 1
+    return counts
+
+
+def theme_words(dream, stop_words=_STOP_WORDS):
+    """
+    Returns a dream's theme words: lowercase, alphabetic, 3+ letters, not a
+    contraction and not in stop_words (the analyzer's by default).
+    """
+    return [word for word in _TOKEN_RE.findall(dream.get_lower_text())
+            if word and word not in stop_words]
+
+
+def count_theme_words(dreams, stop_words=_STOP_WORDS):
+    """
+    Counts theme words across dreams into a Counter: lowercase, alphabetic,
+    3+ letters and not in stop_words (the analyzer's, as in theme_words, by
+    default). Large journals are tokenized by the compiled kernel when Numba
+    is available.
+    """
+    if _use_jit(dreams):
+        buf, counts, starts, lengths = _theme_word_spans(dreams, stop_words)
+        # Decode each distinct word from its first occurrence
+        return Counter({
+            buf[start:start + length].decode("ascii"): count
+            for count, start, length in zip(counts.tolist(), starts.tolist(), lengths.tolist())
+        })
+
+    return _count_theme_words_regex(dreams, stop_words)
+
+
+def top_theme_words(dreams, n):
+    """
+    Returns the n most common theme words across dreams as (word, count)
+    pairs, most common first; ties keep first-seen order like Counter.most_common.
+    Large journals are tokenized by the compiled kernel when Numba is available.
+    """
+    if _use_jit(dreams):
+        buf, counts, starts, lengths = _theme_word_spans(dreams, _STOP_WORDS)
+        # Only the winners are decoded back into strings
+        return [(buf[starts[i]:starts[i] + lengths[i]].decode("ascii"), int(counts[i]))
+                for i in _top_indices(counts, n)]
+
+    return _count_theme_words_regex(dreams, _STOP_WORDS).most_common(n)
+
+
+def _use_jit(dreams):
+    """True if the dreams hold enough text for the compiled word counter, and it loads."""
+    return (NUMBA_AVAILABLE and sum(len(d.text) for d in dreams) >= _JIT_MIN_CHARS
+            and _jit() is not None)
+
+
+def _count_theme_words_regex(dreams, stop_words):
+    """Pure-Python version of count_theme_words."""
+    word_counts = Counter()
+    for dream in dreams:
+        word_counts.update(theme_words(dream, stop_words))
+    return word_counts
+
+
+def _top_indices(counts, n):
+    """Indices of the n largest counts, largest first, ties in index order."""
+    if n >= len(counts):
+        return np.argsort(-counts, kind="stable")
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Partitioning finds the n-th largest count in linear time; everything
+    # at or above it (in index order) is then sorted stably
+    cutoff = -np.partition(-counts, n - 1)[n - 1]
+    candidates = np.flatnonzero(counts >= cutoff)
+    return candidates[np.argsort(-counts[candidates], kind="stable")[:n]]
+
+
+def _theme_word_spans(dreams, stop_words):
+    """
+    Runs the compiled word counter over the dreams' joined lowercase text,
+    skipping stop_words.
+
+    Returns:
+        (buf, counts, starts, lengths): the UTF-8 text and, per distinct word,
+        its count and the byte span of its first occurrence in buf
+    """
+    jit = _jit()
+    stop_hashes = _STOP_HASHES.get(stop_words)
+    if stop_hashes is None:
+        stop_hashes = np.sort(np.array(
+            [jit.fnv1a(np.frombuffer(w.encode("ascii"), dtype=np.uint8)) for w in stop_words],
+            dtype=np.uint64))
+        _STOP_HASHES[stop_words] = stop_hashes
+
+    buf = "\n".join(dream.get_lower_text() for dream in dreams).encode("utf-8")
+    counts, starts, lengths = jit.count_word_hashes(
+        np.frombuffer(buf, dtype=np.uint8), stop_hashes, 3)
+    return buf, counts, starts, lengths
 
 
 class DreamAnalyzer:
@@ -8,29 +199,38 @@ class DreamAnalyzer:
 
     def __init__(self, journal):
         self.journal = journal
-        self.sia = None
-        self._initialize_sentiment_analyzer()
 
-    def _initialize_sentiment_analyzer(self):
-        """Initialize VADER sentiment analyzer with proper setup."""
+    @cached_property
+    def sia(self):
+        """
+        VADER sentiment analyzer, initialized on first use so that creating a
+        DreamAnalyzer does not pay the NLTK import and lexicon loading cost.
+        None if initialization failed.
+        """
+        global _VADER_CHECKED
         try:
             from nltk.sentiment import SentimentIntensityAnalyzer
             from nltk import data as nltk_data
 
-            # Check if vader_lexicon is already downloaded
-            try:
-                nltk_data.find('sentiment/vader_lexicon.zip')
-            except LookupError:
-                # Download only if not found
-                from nltk import download
-                print("Downloading VADER lexicon (one-time setup)...")
-                download("vader_lexicon", quiet=True)
-
-            self.sia = SentimentIntensityAnalyzer()
+            # Check if vader_lexicon is already downloaded. Skipped once the
+            # lexicon has loaded in this process, since the lookup walks every
+            # nltk.data.path directory.
+            if not _VADER_CHECKED:
+                try:
+                    nltk_data.find('sentiment/vader_lexicon.zip')
+                except LookupError:
+                    # Download only if not found
+                    from nltk import download
+                    print("Downloading VADER lexicon (one-time setup)...")
+                    download("vader_lexicon", quiet=True)
+
+            sia = SentimentIntensityAnalyzer()
+            _VADER_CHECKED = True
+            return sia
 
         except Exception as e:
             print(f"Error initializing sentiment analyzer: {e}")
-            self.sia = None
+            return None
 
     def analyze(self):
         """Performs comprehensive dream analysis."""
@@ -40,57 +240,42 @@ class DreamAnalyzer:
         if self.sia is None:
             return "Sentiment analyzer not available. Please check NLTK installation."
 
-        mood_scores = []
-        all_words = []
-
-        # Common stop words to filter out
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'between', 'under', 'again', 'further',
-            'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all',
-            'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
-            'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 's',
-            't', 'can', 'will', 'just', 'don', 'should', 'now', 'was', 'were',
-            'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did',
-            'doing', 'am', 'is', 'are', 'be', 'as', 'i', 'me', 'my', 'myself',
-            'we', 'our', 'ours', 'ourselves', 'you', 'your', 'yours', 'yourself',
-            'yourselves', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers',
-            'herself', 'it', 'its', 'itself', 'they', 'them', 'their', 'theirs',
-            'themselves', 'what', 'which', 'who', 'whom', 'this', 'that', 'these',
-            'those', 'if', 'because', 'while', 'out', 'off', 'over', 'down'
-        }
+        # Snapshot the list so that dreams added or deleted while the analysis
+        # is running (it runs on a worker thread) cannot shift scores onto the
+        # wrong dream
+        dreams = list(self.journal.dreams)
+        score_fn = self.sia.polarity_scores
+
+        # Calculate sentiment scores, reusing scores saved by earlier analyses
+        mood_scores = [
+            dream.mood_score if dream.mood_score is not None
+            else score_fn(dream.text)["compound"]
+            for dream in dreams
+        ]
 
-        for dream in self.journal.dreams:
-            # Calculate sentiment score
-            score = self.sia.polarity_scores(dream.text)["compound"]
-            dream.mood_score = score
-            mood_scores.append(score)
+        dirty = False
+        for dream, score in zip(dreams, mood_scores):
+            if dream.mood_score is None:
+                dream.mood_score = score
+                dirty = True
 
-            # Extract meaningful words
-            words = dream.text.lower().split()
-            filtered_words = [
-                word.strip('.,!?;:()[]{}""\'')
-                for word in words
-                if word.isalpha() and len(word) > 2 and word.lower() not in stop_words
-            ]
-            all_words.extend(filtered_words)
+        # Extract meaningful words. VADER above needs the original casing;
+        # themes reuse the cached lowercase text so it is not rebuilt on
+        # every analysis.
+        top_themes = [word for word, count in top_theme_words(dreams, 10)]
 
-        # Save updated mood scores
-        self.journal.save_dreams()
+        # Save updated mood scores (skipped when every score was already stored)
+        if dirty:
+            self.journal.save_dreams()
 
         # Calculate statistics
         avg_score = sum(mood_scores) / len(mood_scores) if mood_scores else 0
 
-        # Get top themes using Counter
-        word_counts = Counter(all_words)
-        top_themes = [word for word, count in word_counts.most_common(10)]
-
         # ADVANCED: Create mood distribution matrix (multidimensional array)
         mood_matrix = self._create_mood_distribution_matrix(mood_scores)
 
         return {
-            "total_dreams": len(self.journal.dreams),
+            "total_dreams": len(dreams),
             "average_mood": round(avg_score, 3),
             "top_themes": top_themes,
             "mood_matrix": mood_matrix,
@@ -105,6 +290,14 @@ class DreamAnalyzer:
         Rows: Mood categories (Very Negative, Negative, Neutral, Positive, Very Positive)
         Columns: [Count, Min Score, Max Score, Average Score]
         """
+        if NUMBA_AVAILABLE and len(mood_scores) >= _JIT_MIN_SCORES and _jit():
+            matrix = _jit().build_mood_matrix(np.asarray(mood_scores, dtype=np.float64))
+            return [[int(row[0]), float(row[1]), float(row[2]), float(row[3])]
+                    for row in matrix]
+
+        if NUMPY_AVAILABLE:
+            return self._create_mood_distribution_matrix_numpy(mood_scores)
+
         # Initialize 5x4 matrix (5 mood categories x 4 statistics)
         mood_matrix = [
             [0, 1.0, -1.0, 0.0],  # Very Positive: count, min, max, avg
@@ -117,8 +310,8 @@ class DreamAnalyzer:
         category_scores = [[], [], [], [], []]  # Store scores for each category
 
         for score in mood_scores:
-            # Determine category index using recursive categorization
-            category_idx = self._categorize_mood_recursive(score, 0)
+            # Determine category index
+            category_idx = self._categorize_mood(score)
 
             # Update matrix: [count, min, max, sum_for_avg]
             mood_matrix[category_idx][0] += 1  # Increment count
@@ -133,56 +326,35 @@ class DreamAnalyzer:
 
         return mood_matrix
 
-    def _categorize_mood_recursive(self, score, depth=0, max_depth=10):
-        """
-        ADVANCED TOPIC: Recursion
-        Recursively categorizes a mood score into one of 5 categories.
-        Uses recursion with depth limiting to demonstrate the concept.
-
-        Returns category index: 0=Very Positive, 1=Positive, 2=Neutral,
-                                3=Negative, 4=Very Negative
+    def _create_mood_distribution_matrix_numpy(self, mood_scores):
         """
-        # Base case: max depth reached or score categorized
-        if depth >= max_depth:
-            return 2  # Default to neutral
-
-        # Recursive categorization with boundary checking
-        if score >= 0.5:
-            return 0  # Very Positive
-        elif score >= 0.1:
-            # Recursively verify it's in positive range
-            if self._is_in_range_recursive(score, 0.1, 0.5, depth + 1):
-                return 1  # Positive
-        elif score >= -0.1:
-            return 2  # Neutral
-        elif score >= -0.5:
-            # Recursively verify it's in negative range
-            if self._is_in_range_recursive(score, -0.5, -0.1, depth + 1):
-                return 3  # Negative
-        else:
-            return 4  # Very Negative
-
-        # Fallback recursive call
-        return self._categorize_mood_recursive(score, depth + 1)
-
-    def _is_in_range_recursive(self, value, min_val, max_val, depth=0, max_depth=5):
+        Vectorized version of _create_mood_distribution_matrix.
+        Buckets all scores in one pass instead of looping in Python.
         """
-        ADVANCED TOPIC: Recursion (Helper)
-        Recursively checks if a value is within a range.
-        Demonstrates recursive boundary checking.
-        """
-        # Base case
-        if depth >= max_depth:
-            return min_val <= value < max_val
-
-        # Recursive case: check boundaries step by step
-        if value < min_val:
-            return False
-        elif value >= max_val:
-            return False
-        else:
-            # Recursively confirm with increased depth
-            return self._is_in_range_recursive(value, min_val, max_val, depth + 1)
+        scores = np.asarray(mood_scores, dtype=np.float64)
+        idx = 4 - np.digitize(scores, MOOD_THRESHOLDS)
+
+        counts = np.bincount(idx, minlength=5)
+        sums = np.bincount(idx, weights=scores, minlength=5)
+        mins = np.full(5, np.inf)
+        maxs = np.full(5, -np.inf)
+        np.minimum.at(mins, idx, scores)
+        np.maximum.at(maxs, idx, scores)
+
+        # Empty categories keep the same defaults as the pure-Python path
+        filled = counts > 0
+        mins = np.where(filled, mins, 1.0)
+        maxs = np.where(filled, maxs, -1.0)
+        avgs = np.divide(sums, counts, out=np.zeros(5), where=filled)
+
+        return [
+            [int(counts[i]), float(mins[i]), float(maxs[i]), float(avgs[i])]
+            for i in range(5)
+        ]
+
+    def _categorize_mood(self, score):
+        """Categorizes a mood score into one of 5 categories (see mood_category)."""
+        return mood_category(score)
 
     def get_mood_distribution_summary(self):
         """Returns a formatted summary of the mood distribution matrix."""
@@ -0,0 +1,170 @@
+# analyzer_jit.py
+"""
+Optional Numba-compiled kernels for Dream Journal Analyzer.
+Importing this module raises ImportError when numba is not installed,
+so callers can fall back to their NumPy / pure-Python paths.
+"""
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+# 64-bit FNV-1a parameters
+_FNV_OFFSET = np.uint64(14695981039346656037)
+_FNV_PRIME = np.uint64(1099511628211)
+
+
+@njit(cache=True)
+def build_mood_matrix(scores):
+    """
+    Builds the 5x4 mood distribution matrix in a single compiled pass.
+
+    Args:
+        scores: 1-D float64 array of mood scores
+
+    Returns:
+        5x4 float64 array of [count, min, max, avg] per mood category,
+        ordered Very Positive .. Very Negative
+    """
+    counts = np.zeros(5)
+    sums = np.zeros(5)
+    mins = np.full(5, np.inf)
+    maxs = np.full(5, -np.inf)
+
+    for s in scores:
+        if s >= 0.5:
+            c = 0
+        elif s >= 0.1:
+            c = 1
+        elif s >= -0.1:
+            c = 2
+        elif s >= -0.5:
+            c = 3
+        else:
+            c = 4
+
+        counts[c] += 1
+        sums[c] += s
+        if s < mins[c]:
+            mins[c] = s
+        if s > maxs[c]:
+            maxs[c] = s
+
+    matrix = np.empty((5, 4))
+    for i in range(5):
+        if counts[i] > 0:
+            matrix[i, 0] = counts[i]
+            matrix[i, 1] = mins[i]
+            matrix[i, 2] = maxs[i]
+            matrix[i, 3] = sums[i] / counts[i]
+        else:
+            # Same defaults as the pure-Python path for empty categories
+            matrix[i, 0] = 0.0
+            matrix[i, 1] = 1.0
+            matrix[i, 2] = -1.0
+            matrix[i, 3] = 0.0
+
+    return matrix
+
+
+@njit(cache=True)
+def fnv1a(word):
+    """
+    Hashes a byte string with 64-bit FNV-1a.
+
+    Args:
+        word: 1-D uint8 array
+
+    Returns:
+        uint64 hash, the same value count_word_hashes uses for that word
+    """
+    h = _FNV_OFFSET
+    for c in word:
+        h = (h ^ np.uint64(c)) * _FNV_PRIME
+    return h
+
+
+@njit(cache=True)
+def _grow(arr, size):
+    """Returns a copy of arr enlarged to size entries (the extra entries zeroed)."""
+    grown = np.zeros(size, dtype=arr.dtype)
+    grown[:len(arr)] = arr
+    return grown
+
+
+@njit(cache=True)
+def count_word_hashes(buf, stop_hashes, min_len):
+    """
+    Counts the words (runs of a-z bytes) in a lowercased UTF-8 buffer in a
+    single compiled pass, keyed by their FNV-1a hash. Runs joined by an
+    apostrophe (' or U+2019), such as "won't", are skipped as a whole, like
+    analyzer._TOKEN_RE does.
+
+    Args:
+        buf: 1-D uint8 array of lowercased text
+        stop_hashes: Sorted uint64 array of hashes of words to skip
+        min_len: Shortest word to count
+
+    Returns:
+        (counts, starts, lengths) int64 arrays with one entry per distinct
+        word: its count and the byte span of its first occurrence in buf
+    """
+    n = len(buf)
+    slots = Dict.empty(key_type=types.uint64, value_type=types.int64)
+    # Per-word arrays start small and double when full, since a journal's
+    # vocabulary is far smaller than its text
+    capacity = 1024
+    counts = np.zeros(capacity, dtype=np.int64)
+    starts = np.zeros(capacity, dtype=np.int64)
+    lengths = np.zeros(capacity, dtype=np.int64)
+    distinct = 0
+
+    i = 0
+    while i < n:
+        if buf[i] < 97 or buf[i] > 122:
+            i += 1
+            continue
+
+        start = i
+        h = _FNV_OFFSET
+        while i < n and 97 <= buf[i] <= 122:
+            h = (h ^ np.uint64(buf[i])) * _FNV_PRIME
+            i += 1
+        end = i
+
+        # Consume any apostrophe-joined continuations (contractions, possessives)
+        joined = False
+        while True:
+            if i + 1 < n and buf[i] == 39 and 97 <= buf[i + 1] <= 122:
+                i += 1
+            elif (i + 3 < n and buf[i] == 0xE2 and buf[i + 1] == 0x80
+                  and buf[i + 2] == 0x99 and 97 <= buf[i + 3] <= 122):
+                i += 3
+            else:
+                break
+            joined = True
+            while i < n and 97 <= buf[i] <= 122:
+                i += 1
+
+        if joined or end - start < min_len:
+            continue
+        j = np.searchsorted(stop_hashes, h)
+        if j < len(stop_hashes) and stop_hashes[j] == h:
+            continue
+
+        if h in slots:
+            slot = slots[h]
+        else:
+            if distinct == capacity:
+                capacity *= 2
+                counts = _grow(counts, capacity)
+                starts = _grow(starts, capacity)
+                lengths = _grow(lengths, capacity)
+            slot = distinct
+            slots[h] = slot
+            starts[slot] = start
+            lengths[slot] = end - start
+            distinct += 1
+        counts[slot] += 1
+
+    return counts[:distinct], starts[:distinct], lengths[:distinct]
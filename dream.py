@@ -1,23 +1,56 @@
 # dream.py
+from datetime import datetime
+
 
 class Dream:
     """Represents a single dream entry with text, date, and mood score."""
 
+    # No per-instance __dict__; journals can hold thousands of dreams
+    __slots__ = ("_text", "_date", "mood_score", "_lower", "_word_count", "_preview",
+                 "_date_obj")
+
     def __init__(self, text, date, mood_score=None):
-        if not text or not isinstance(text, str):
+        self.text = text
+        self.date = date
+        self.mood_score = mood_score
+
+    @property
+    def text(self):
+        """The dream text."""
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        """Sets the dream text and refreshes the values derived from it."""
+        if not value or not isinstance(value, str):
             raise ValueError("Dream text must be a non-empty string")
-        if not date or not isinstance(date, str):
+
+        self._text = value.strip()
+        self._lower = self._text.lower()
+        self._word_count = len(self._text.split())
+        self._preview = self._text[:50] + "..." if len(self._text) > 50 else self._text
+
+        # Any stored mood score belongs to the old text
+        self.mood_score = None
+
+    @property
+    def date(self):
+        """The dream date as a YYYY-MM-DD string."""
+        return self._date
+
+    @date.setter
+    def date(self, value):
+        """Sets the dream date and drops the cached parsed date."""
+        if not value or not isinstance(value, str):
             raise ValueError("Dream date must be a non-empty string")
 
-        self.text = text.strip()
-        self.date = date
-        self.mood_score = mood_score
+        self._date = value
+        self._date_obj = None
 
     def __str__(self):
         """Returns a readable string representation of the dream."""
-        preview = self.text[:50] + "..." if len(self.text) > 50 else self.text
         mood_str = f" (Mood: {self.mood_score:.2f})" if self.mood_score is not None else ""
-        return f"{self.date}: {preview}{mood_str}"
+        return f"{self.date}: {self._preview}{mood_str}"
 
     def __repr__(self):
         """Returns a detailed representation for debugging."""
@@ -50,8 +83,25 @@ class Dream:
 
     def get_word_count(self):
         """Returns the word count of the dream text."""
-        return len(self.text.split())
+        return self._word_count
+
+    def get_preview(self):
+        """Returns the first 50 characters of the text, with "..." if truncated."""
+        return self._preview
+
+    def get_date_obj(self):
+        """
+        Returns the date parsed as a datetime, parsing it only on first use.
+        Raises ValueError if the date is not in YYYY-MM-DD format.
+        """
+        if self._date_obj is None:
+            self._date_obj = datetime.strptime(self._date, "%Y-%m-%d")
+        return self._date_obj
+
+    def get_lower_text(self):
+        """Returns the lowercased dream text (cached whenever the text is set)."""
+        return self._lower
 
     def contains_keyword(self, keyword):
         """Checks if dream contains a specific keyword (case-insensitive)."""
-        return keyword.lower() in self.text.lower()
+        return keyword.lower() in self._lower
@@ -1,73 +1,168 @@
 # journal.py
 import json
 import os
+import shutil
+import threading
 from dream import Dream
 
+# Use orjson (native, several times faster) when available, else stdlib json
+try:
+    import orjson
+
+    def _encode_line(obj):
+        return orjson.dumps(obj) + b"\n"
+
+    _decode = orjson.loads
+except ImportError:
+    def _encode_line(obj):
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _decode = json.loads
+
 
 class DreamJournal:
     """Handles file I/O and storage of Dream objects."""
 
-    def __init__(self, filename="dreams.json"):
+    def __init__(self, filename="dreams.jsonl"):
         self.filename = filename
+        # Serializes file writes and list changes; the analyzer saves mood
+        # scores from a worker thread while the UI may add or delete dreams
+        self._lock = threading.RLock()
         self.dreams = self.load_dreams()
+        # Bumped on every add or delete, so callers can tell whether the
+        # dream list changed since they last looked
+        self.revision = 0
+
+        # Date -> dreams index so date lookups don't scan the whole journal
+        self._by_date = {}
+        for dream in self.dreams:
+            self._by_date.setdefault(dream.date, []).append(dream)
 
     def load_dreams(self):
-        """Loads dreams from file with error handling."""
+        """Loads dreams from a JSON-Lines file (one dream per line) with error handling."""
         if not os.path.exists(self.filename):
+            legacy_filename = os.path.splitext(self.filename)[0] + ".json"
+            if self.filename.endswith(".jsonl") and os.path.exists(legacy_filename):
+                return self._migrate_legacy_json(legacy_filename)
+
             print(f"No existing journal found. Creating new file: {self.filename}")
             return []
 
         try:
-            with open(self.filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-                # Validate data structure
-                if not isinstance(data, list):
-                    print("Invalid journal format. Resetting...")
-                    self.reset_file()
-                    return []
-
-                dreams = []
-                for entry in data:
+            # A legacy JSON array (such as an old dreams.json) is not JSON-Lines;
+            # convert it in place instead of dropping every line as corrupted
+            if self._is_json_array(self.filename):
+                return self._migrate_legacy_json(self.filename)
+
+            dreams = []
+            corrupted = False
+
+            with open(self.filename, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
                     try:
-                        dreams.append(Dream.from_dict(entry))
-                    except (KeyError, TypeError) as e:
+                        dreams.append(Dream.from_dict(_decode(line)))
+                    except (ValueError, KeyError, TypeError) as e:
                         print(f"Skipping corrupted dream entry: {e}")
-                        continue
+                        corrupted = True
+
+            # Rewrite the file without the bad lines so later appends start
+            # clean, keeping the original (bad lines included) as a backup
+            if corrupted:
+                backup_name = f"{self.filename}.backup"
+                try:
+                    shutil.copyfile(self.filename, backup_name)
+                    print(f"Corrupted file backed up to: {backup_name}")
+                except Exception:
+                    pass
+                self._write_all(dreams)
+
+            return dreams
+
+        except Exception as e:
+            print(f"Unexpected error loading dreams: {e}")
+            return []
 
-                return dreams
+    @staticmethod
+    def _is_json_array(filename):
+        """Returns True if the file's first non-whitespace byte is '[' (a legacy JSON array)."""
+        with open(filename, "rb") as f:
+            while True:
+                chunk = f.read(4096)
+                if not chunk:
+                    return False
+                chunk = chunk.lstrip()
+                if chunk:
+                    return chunk[:1] == b"["
+
+    def _migrate_legacy_json(self, legacy_filename):
+        """Imports dreams from a legacy JSON array file and writes them as JSON-Lines."""
+        try:
+            with open(legacy_filename, "rb") as f:
+                data = _decode(f.read())
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"Corrupted JSON file detected: {e}")
             # Backup corrupted file
-            backup_name = f"{self.filename}.backup"
+            backup_name = f"{legacy_filename}.backup"
             try:
-                os.rename(self.filename, backup_name)
+                os.rename(legacy_filename, backup_name)
                 print(f"Corrupted file backed up to: {backup_name}")
             except Exception:
                 pass
-
-            self.reset_file()
             return []
 
         except Exception as e:
             print(f"Unexpected error loading dreams: {e}")
             return []
 
+        # Validate data structure
+        if not isinstance(data, list):
+            print("Invalid legacy journal format. Starting a new journal...")
+            return []
+
+        dreams = []
+        for entry in data:
+            try:
+                dreams.append(Dream.from_dict(entry))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Skipping corrupted dream entry: {e}")
+                continue
+
+        # Converting in place overwrites the array file, so keep a copy of it
+        if legacy_filename == self.filename:
+            backup_name = f"{legacy_filename}.backup"
+            try:
+                shutil.copyfile(legacy_filename, backup_name)
+                print(f"Legacy journal backed up to: {backup_name}")
+            except Exception:
+                pass
+
+        self._write_all(dreams)
+        print(f"Imported {len(dreams)} dreams from {legacy_filename} into {self.filename}")
+        return dreams
+
     def save_dreams(self):
-        """Saves dreams to file with error handling."""
+        """Rewrites (compacts) the whole journal file from the in-memory dreams."""
+        with self._lock:
+            self._write_all(self.dreams)
+
+    def _write_all(self, dreams):
+        """Atomically writes the given dreams to file, one JSON object per line."""
         try:
             # Create temporary file first
             temp_filename = f"{self.filename}.tmp"
 
-            with open(temp_filename, "w", encoding="utf-8") as f:
-                json.dump([d.to_dict() for d in self.dreams], f, indent=2, ensure_ascii=False)
+            # Stream one dream at a time instead of building the whole list in memory
+            with open(temp_filename, "wb") as f:
+                for dream in dreams:
+                    f.write(_encode_line(dream.to_dict()))
 
-            # Replace original file only if write succeeded
-            if os.path.exists(self.filename):
-                os.replace(temp_filename, self.filename)
-            else:
-                os.rename(temp_filename, self.filename)
+            # Replace original file only if write succeeded (os.replace is atomic
+            # and works whether or not the destination exists)
+            os.replace(temp_filename, self.filename)
 
         except Exception as e:
             print(f"Error saving dreams: {e}")
@@ -79,18 +174,25 @@ class DreamJournal:
                     pass
 
     def add_dream(self, dream):
-        """Adds a dream to the journal."""
+        """Adds a dream to the journal by appending a single line to the file."""
         if not isinstance(dream, Dream):
             raise TypeError("Only Dream objects can be added to the journal")
 
-        self.dreams.append(dream)
-        self.save_dreams()
+        with self._lock:
+            self.dreams.append(dream)
+            self._by_date.setdefault(dream.date, []).append(dream)
+            self.revision += 1
+            try:
+                with open(self.filename, "ab") as f:
+                    f.write(_encode_line(dream.to_dict()))
+            except Exception as e:
+                print(f"Error saving dream: {e}")
 
     def reset_file(self):
         """Clears the journal file."""
         try:
-            with open(self.filename, "w", encoding="utf-8") as f:
-                json.dump([], f)
+            with open(self.filename, "w", encoding="utf-8"):
+                pass
             print(f"Journal file reset: {self.filename}")
         except Exception as e:
             print(f"Error resetting file: {e}")
@@ -101,12 +203,29 @@ class DreamJournal:
 
     def get_dreams_by_date(self, date_str):
         """Returns all dreams from a specific date."""
-        return [d for d in self.dreams if d.date == date_str]
+        return list(self._by_date.get(date_str, ()))
 
     def delete_dream(self, index):
         """Deletes a dream by index."""
-        if 0 <= index < len(self.dreams):
-            deleted = self.dreams.pop(index)
+        with self._lock:
+            if 0 <= index < len(self.dreams):
+                deleted = self.dreams.pop(index)
+                self.revision += 1
+
+                bucket = self._by_date.get(deleted.date)
+                if bucket is not None:
+                    bucket.remove(deleted)
+                    if not bucket:
+                        del self._by_date[deleted.date]
+
+                self.save_dreams()
+                return deleted
+            return None
+
+    def delete_all_dreams(self):
+        """Deletes every dream from the journal."""
+        with self._lock:
+            self.dreams.clear()
+            self._by_date.clear()
+            self.revision += 1
             self.save_dreams()
-            return deleted
-        return None
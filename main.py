@@ -11,7 +11,7 @@ def main():
     print("=" * 60)
 
     # Initialize journal and UI
-    journal = DreamJournal("dreams.json")
+    journal = DreamJournal("dreams.jsonl")
     ui = DreamUI(journal)
 
     print(f"Loaded {journal.get_dream_count()} existing dreams.")
@@ -1,18 +1,62 @@
 # ui.py
+from collections import Counter
+from contextlib import contextmanager
+import importlib.util
+import re
+import threading
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 from dream import Dream
-from analyzer import DreamAnalyzer
-from datetime import date, datetime
-
-# Try to import visualizer
-try:
-    from visualizer import DreamVisualizer
-
-    VISUALIZER_AVAILABLE = DreamVisualizer.is_available()
-except ImportError:
-    VISUALIZER_AVAILABLE = False
+from analyzer import DreamAnalyzer, count_moods, mood_category
+from datetime import date
+
+# Check for matplotlib without importing it; the visualizer (and matplotlib)
+# is only imported the first time a chart tab is opened
+VISUALIZER_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+# Section separator used throughout the results and dream list views
+_SEP = "=" * 60
+
+# Skeleton of the analysis report; filled in by DreamUI._format_analysis
+_REPORT_TMPL = (
+    "📊 DREAM ANALYSIS\n"
+    "{sep}\n\n"
+    "MOOD SCORE LEGEND:\n"
+    "  😊 Very Positive:  +0.5 to +1.0\n"
+    "  🙂 Positive:       +0.1 to +0.5\n"
+    "  😐 Neutral:        -0.1 to +0.1\n"
+    "  😔 Negative:       -0.5 to -0.1\n"
+    "  😢 Very Negative:  -1.0 to -0.5\n\n"
+    "{sep}\n\n"
+    "Total Dreams Recorded: {total}\n\n"
+    "Average Mood Score: {avg} {mood}\n\n"
+    "Individual Dream Mood Scores:\n"
+    "{dreams}"
+    "\nTop Recurring Themes:\n"
+    "{themes}"
+    "\n{sep}\n"
+    "{tip}"
+)
+_REPORT_TIP = "\n💡 TIP: Check out the visualization tabs above for interactive charts!\n"
+
+# One report entry per dream: number, date, score, interpretation, preview
+_DREAM_FMT = "  {0}. [{1}] {2} {3}\n     \"{4}\"\n".format
+
+# Label for each mood category, indexed by analyzer.mood_category()
+_MOOD_LABELS = ("😊 (Very Positive)", "🙂 (Positive)", "😐 (Neutral)",
+                "😔 (Negative)", "😢 (Very Negative)")
+
+# Rows added to the delete dialog's dream list per scroll-to-bottom
+_ROW_CHUNK = 200
+
+# YYYY-MM-DD; checked before building a date so strptime's format parser is skipped
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+def _ellipsize(text, width=40):
+    """Returns text cut to width characters, with "..." appended if it was cut."""
+    return text[:width] + "..." if len(text) > width else text
 
 
 class DreamUI:
@@ -20,7 +64,22 @@ class DreamUI:
 
     def __init__(self, journal):
         self.journal = journal
-        self.visualizer = DreamVisualizer(journal) if VISUALIZER_AVAILABLE else None
+        self.visualizer = None  # created on first use by _get_visualizer()
+        self._today_cached = (None, None)  # (date, ISO string) for _today_str()
+
+        # Analysis report reused while the journal revision is unchanged
+        self._analysis_cache = {'label': None, 'text': None}
+        self._analysis_in_flight = False
+
+        # Chart aggregates kept up to date on add/delete instead of rescanning
+        # the journal on every refresh: theme word counts (built on the first
+        # themes refresh, see _theme_counts()), and dreams per mood category
+        # (Very Positive .. Very Negative, scored dreams only)
+        self._theme_counter = None
+        self._mood_hist = self._count_moods()
+        # True while the results box holds an analysis report
+        self._analysis_shown = False
+
         self.root = tk.Tk()
         self.root.title("Dream Journal Analyzer")
         self.root.geometry("1400x700")
@@ -50,7 +109,7 @@ class DreamUI:
 
         tk.Label(date_frame, text="Date:", font=("Arial", 9)).pack(anchor=tk.W)
         self.date_entry = tk.Entry(date_frame, width=25, font=("Arial", 10))
-        self.date_entry.insert(0, str(date.today()))
+        self.date_entry.insert(0, self._today_str())
         self.date_entry.pack(fill=tk.X, pady=(2, 0))
         tk.Label(date_frame, text="(YYYY-MM-DD)", fg="gray", font=("Arial", 8)).pack(anchor=tk.W)
 
@@ -104,9 +163,11 @@ class DreamUI:
         results_container = tk.Frame(analysis_tab, relief=tk.SUNKEN, borderwidth=1)
         results_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
+        # Read-only views: no undo history to maintain on each insert
         self.output_text = tk.Text(results_container, wrap=tk.WORD,
                                    font=("Arial", 10), state=tk.DISABLED,
-                                   bg="#f5f5f5")
+                                   bg="#f5f5f5", undo=False,
+                                   autoseparators=False, maxundo=0)
         output_scrollbar = tk.Scrollbar(results_container, command=self.output_text.yview)
         self.output_text.config(yscrollcommand=output_scrollbar.set)
 
@@ -114,19 +175,18 @@ class DreamUI:
         output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Initial message
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.insert("1.0", "Welcome to Dream Journal Analyzer! 🌙\n\n"
-                                       "Add your dreams and click 'Analyze Dreams' to see insights.\n\n"
-                                       "Your analysis results will appear here...\n\n"
-                                       f"{'=' * 60}\n\n"
-                                       "MOOD SCORE LEGEND:\n"
-                                       "  😊 Very Positive:  +0.5 to +1.0\n"
-                                       "  🙂 Positive:       +0.1 to +0.5\n"
-                                       "  😐 Neutral:        -0.1 to +0.1\n"
-                                       "  😔 Negative:       -0.5 to -0.1\n"
-                                       "  😢 Very Negative:  -1.0 to -0.5\n\n"
-                                       f"{'=' * 60}")
-        self.output_text.config(state=tk.DISABLED)
+        with self._editable(self.output_text) as text:
+            text.insert("1.0", "Welcome to Dream Journal Analyzer! 🌙\n\n"
+                                "Add your dreams and click 'Analyze Dreams' to see insights.\n\n"
+                                "Your analysis results will appear here...\n\n"
+                                f"{_SEP}\n\n"
+                                "MOOD SCORE LEGEND:\n"
+                                "  😊 Very Positive:  +0.5 to +1.0\n"
+                                "  🙂 Positive:       +0.1 to +0.5\n"
+                                "  😐 Neutral:        -0.1 to +0.1\n"
+                                "  😔 Negative:       -0.5 to -0.1\n"
+                                "  😢 Very Negative:  -1.0 to -0.5\n\n"
+                                f"{_SEP}")
 
         # Tab 2, 3, 4: Visualizations (only if matplotlib available)
         if VISUALIZER_AVAILABLE:
@@ -144,6 +204,14 @@ class DreamUI:
 
             # Setup visualization tabs
             self._setup_visualization_tabs()
+
+            # Build each chart when its tab is first opened
+            self._chart_tabs = {
+                str(self.timeline_tab): "timeline",
+                str(self.distribution_tab): "distribution",
+                str(self.themes_tab): "themes",
+            }
+            self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         else:
             # Show message about matplotlib
             no_viz_tab = tk.Frame(self.notebook)
@@ -193,24 +261,74 @@ class DreamUI:
         self.themes_canvas_frame = tk.Frame(self.themes_tab)
         self.themes_canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
-        # Show initial "click refresh" message
-        for frame in [self.timeline_canvas_frame, self.dist_canvas_frame, self.themes_canvas_frame]:
+        # Chart name -> (frame, data step run on a worker thread or None,
+        #                builder run on the Tk thread, message when there is nothing to plot)
+        self._charts = {
+            "timeline": (self.timeline_canvas_frame,
+                         lambda: self.visualizer.prepare_timeline_data(),
+                         lambda frame, data: (self.visualizer.create_mood_timeline(frame, data)
+                                              if data else None),
+                         "No mood scores available. Click 'Analyze Dreams' first!"),
+            "distribution": (self.dist_canvas_frame, None,
+                             lambda frame, data: self.visualizer.create_mood_distribution(
+                                 frame, counts=self._mood_hist),
+                             "No mood scores available. Click 'Analyze Dreams' first!"),
+            "themes": (self.themes_canvas_frame, None,
+                       lambda frame, data: self.visualizer.create_themes_chart(
+                           frame, word_counts=self._theme_counts()),
+                       "No themes to visualize."),
+        }
+        # Charts with a rebuild queued, and the data label each chart last showed
+        self._pending_charts = set()
+        self._chart_labels = {}
+        self._chart_widgets = {}
+
+        # Show initial "click refresh" message. Each chart keeps this one label
+        # and swaps it with its canvas instead of recreating widgets.
+        self._chart_placeholders = {}
+        for chart, (frame, _, _, _) in self._charts.items():
             label = tk.Label(frame, text="Click 'Refresh' button above to generate visualization",
                              font=("Arial", 11), fg="#666")
             label.pack(expand=True)
+            self._chart_placeholders[chart] = label
+
+    def _get_visualizer(self):
+        """Returns the DreamVisualizer, importing matplotlib on first use."""
+        if self.visualizer is None:
+            from visualizer import DreamVisualizer
+            self.visualizer = DreamVisualizer(self.journal)
+        return self.visualizer
+
+    def _on_tab_changed(self, event):
+        """Draws a chart when its tab is selected (no-op if its data is unchanged)."""
+        chart = self._chart_tabs.get(self.notebook.select())
+        if chart is not None:
+            self._schedule_chart_refresh(chart)
+
+    def _today_str(self):
+        """Today's date as YYYY-MM-DD, re-formatted only when the day changes."""
+        today = date.today()
+        if today != self._today_cached[0]:
+            self._today_cached = (today, today.isoformat())
+        return self._today_cached[1]
 
     def validate_date(self, date_str):
         """Validates date format and returns date object or None."""
+        match = _DATE_RE.match(date_str)
         try:
-            dream_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            if dream_date > date.today():
-                messagebox.showwarning("Invalid Date", "Dream date cannot be in the future.")
-                return None
-            return dream_date
+            if match is None:
+                raise ValueError(date_str)
+            year, month, day = map(int, match.groups())
+            dream_date = date(year, month, day)
         except ValueError:
             messagebox.showwarning("Invalid Date", "Please enter date in YYYY-MM-DD format.")
             return None
 
+        if dream_date > date.today():
+            messagebox.showwarning("Invalid Date", "Dream date cannot be in the future.")
+            return None
+        return dream_date
+
     def add_dream(self):
         text = self.text_entry.get("1.0", tk.END).strip()
         date_str = self.date_entry.get().strip()
@@ -223,156 +341,231 @@ class DreamUI:
         if not dream_date:
             return
 
-        dream = Dream(text, str(dream_date))
+        dream = Dream(text, dream_date.isoformat())
         self.journal.add_dream(dream)
+        if self._theme_counter is not None:
+            self._theme_counter.update(self.visualizer.theme_words(dream))
         messagebox.showinfo("Success", "Dream saved successfully!")
 
         # Clear entry and reset date
         self.text_entry.delete("1.0", tk.END)
         self.date_entry.delete(0, tk.END)
-        self.date_entry.insert(0, str(date.today()))
+        self.date_entry.insert(0, self._today_str())
 
     def show_analysis(self):
-        analyzer = DreamAnalyzer(self.journal)
-        result = analyzer.analyze()
+        # Reuse the last report while the journal contents are unchanged
+        label = self._data_label()
+        if label == self._analysis_cache['label']:
+            self._show_output(self._analysis_cache['text'], is_report=True)
+            return
 
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete("1.0", tk.END)
+        # Only one analysis at a time; repeated clicks wait for the running one
+        if self._analysis_in_flight:
+            return
+        self._analysis_in_flight = True
+
+        # Sentiment scoring can take a while, so run it off the Tk main thread
+        self._show_output("⏳ Analyzing dreams...")
+        threading.Thread(target=self._run_analysis, args=(label,), daemon=True).start()
+
+    def _run_analysis(self, label):
+        """Worker thread: runs the analyzer and hands the result back to the Tk thread."""
+        try:
+            result = DreamAnalyzer(self.journal).analyze()
+        except Exception as e:
+            result = f"Error analyzing dreams: {e}"
+        self.root.after(0, self._render_analysis, label, result)
+
+    def _render_analysis(self, label, result):
+        """Displays an analysis result (main thread only)."""
+        self._analysis_in_flight = False
+
+        # The worker may have scored dreams even if the result is stale or an
+        # error, so recount the histogram before anything can return early
+        self._mood_hist = self._count_moods()
+
+        # Dreams were added or deleted while analyzing; the result is stale
+        if label != self._data_label():
+            self.show_analysis()
+            return
 
         if isinstance(result, str):
-            self.output_text.insert("1.0", result)
+            self._show_output(result)
         else:
-            mood_interpretation = self.interpret_mood(result['average_mood'])
-            text = (
-                f"📊 DREAM ANALYSIS\n"
-                f"{'=' * 60}\n\n"
-                f"MOOD SCORE LEGEND:\n"
-                f"  😊 Very Positive:  +0.5 to +1.0\n"
-                f"  🙂 Positive:       +0.1 to +0.5\n"
-                f"  😐 Neutral:        -0.1 to +0.1\n"
-                f"  😔 Negative:       -0.5 to -0.1\n"
-                f"  😢 Very Negative:  -1.0 to -0.5\n\n"
-                f"{'=' * 60}\n\n"
-                f"Total Dreams Recorded: {result['total_dreams']}\n\n"
-                f"Average Mood Score: {result['average_mood']} {mood_interpretation}\n\n"
-            )
-
-            # Add individual dream mood scores
-            text += f"Individual Dream Mood Scores:\n"
-            for i, dream in enumerate(self.journal.dreams, 1):
-                mood_str = f"{dream.mood_score:.3f}" if dream.mood_score is not None else "N/A"
-                mood_interp = self.interpret_mood(dream.mood_score) if dream.mood_score is not None else ""
-                preview = dream.text[:40] + "..." if len(dream.text) > 40 else dream.text
-                text += f"  {i}. [{dream.date}] {mood_str} {mood_interp}\n"
-                text += f"     \"{preview}\"\n"
-
-            text += f"\nTop Recurring Themes:\n"
-            for i, theme in enumerate(result['top_themes'], 1):
-                text += f"  {i}. {theme.capitalize()}\n"
-
-            text += f"\n{'=' * 60}\n"
-            if VISUALIZER_AVAILABLE:
-                text += "\n💡 TIP: Check out the visualization tabs above for interactive charts!\n"
-
-            self.output_text.insert("1.0", text)
-
-        self.output_text.config(state=tk.DISABLED)
+            text = self._format_analysis(result)
+            self._analysis_cache = {'label': label, 'text': text}
+            self._show_output(text, is_report=True)
+            # The analysis scored any new dreams; bring an open timeline up to date
+            if VISUALIZER_AVAILABLE and "timeline" in self._chart_widgets:
+                self._schedule_chart_refresh("timeline")
+
+    def _show_output(self, text, is_report=False):
+        """Replaces the contents of the read-only results box."""
+        self._analysis_shown = is_report
+        with self._editable(self.output_text) as output:
+            output.delete("1.0", tk.END)
+            output.insert("1.0", text)
+
+    @staticmethod
+    @contextmanager
+    def _editable(widget):
+        """Temporarily makes a read-only Text widget editable."""
+        widget.configure(state=tk.NORMAL)
+        try:
+            yield widget
+        finally:
+            widget.configure(state=tk.DISABLED)
+
+    def _format_analysis(self, result):
+        """Builds the analysis report text from an analyze() result dictionary."""
+        # Per-dream lines (hot names bound to locals for the loop)
+        parts = []
+        append = parts.append
+        ellipsize = _ellipsize
+        interpret = self.interpret_mood
+        dream_fmt = _DREAM_FMT
+        for i, dream in enumerate(self.journal.dreams, 1):
+            score = dream.mood_score
+            if score is not None:
+                mood_str, mood_interp = f"{score:.3f}", interpret(score)
+            else:
+                mood_str, mood_interp = "N/A", ""
+            append(dream_fmt(i, dream.date, mood_str, mood_interp, ellipsize(dream.text)))
+
+        themes = "".join(f"  {i}. {theme.capitalize()}\n"
+                         for i, theme in enumerate(result['top_themes'], 1))
+
+        # Fill the static report skeleton in one pass
+        return _REPORT_TMPL.format_map({
+            'sep': _SEP,
+            'total': result['total_dreams'],
+            'avg': result['average_mood'],
+            'mood': interpret(result['average_mood']),
+            'dreams': "".join(parts),
+            'themes': themes,
+            'tip': _REPORT_TIP if VISUALIZER_AVAILABLE else "",
+        })
+
+    def _data_label(self):
+        """Cheap fingerprint of the journal contents: (dream count, journal revision)."""
+        return len(self.journal.dreams), self.journal.revision
+
+    def _count_moods(self):
+        """Counts scored dreams per mood category, ordered Very Positive .. Very Negative."""
+        return count_moods(self.journal.dreams)
+
+    def _forget_dream(self, dream):
+        """Removes a deleted dream from the chart aggregates."""
+        # While an analysis runs, its worker may have scored the dream without
+        # it being counted yet; _render_analysis recounts the histogram then
+        if dream.mood_score is not None and not self._analysis_in_flight:
+            self._mood_hist[mood_category(dream.mood_score)] -= 1
+
+        counter = self._theme_counter
+        if counter is None:
+            return
+        for word, count in Counter(self.visualizer.theme_words(dream)).items():
+            remaining = counter[word] - count
+            if remaining > 0:
+                counter[word] = remaining
+            else:
+                del counter[word]
+
+    def _theme_counts(self):
+        """Theme word counts for the themes chart, counted from the journal on first use."""
+        if self._theme_counter is None:
+            self._theme_counter = self._get_visualizer().theme_counts()
+        return self._theme_counter
 
     def interpret_mood(self, score):
         """Provides interpretation of mood score."""
         if score is None:
             return ""
-        if score >= 0.5:
-            return "😊 (Very Positive)"
-        elif score >= 0.1:
-            return "🙂 (Positive)"
-        elif score >= -0.1:
-            return "😐 (Neutral)"
-        elif score >= -0.5:
-            return "😔 (Negative)"
-        else:
-            return "😢 (Very Negative)"
+        return _MOOD_LABELS[mood_category(score)]
 
     def refresh_timeline(self):
         """Refresh the mood timeline chart using visualizer.py."""
-        if not VISUALIZER_AVAILABLE or not self.visualizer:
-            return
+        self._schedule_chart_refresh("timeline")
 
-        # Clear previous canvas
-        for widget in self.timeline_canvas_frame.winfo_children():
-            widget.destroy()
+    def refresh_distribution(self):
+        """Refresh the mood distribution chart using visualizer.py."""
+        self._schedule_chart_refresh("distribution")
 
-        if not self.journal.dreams:
-            label = tk.Label(self.timeline_canvas_frame,
-                             text="No dreams to visualize. Add some dreams first!",
-                             font=("Arial", 11), fg="#666")
-            label.pack(expand=True)
+    def refresh_themes(self):
+        """Refresh the top themes chart using visualizer.py."""
+        self._schedule_chart_refresh("themes")
+
+    def _schedule_chart_refresh(self, chart):
+        """Coalesces repeated refresh requests into one rebuild on the next idle tick."""
+        if not VISUALIZER_AVAILABLE:
             return
 
-        # Use visualizer to create chart
-        chart_widget = self.visualizer.create_mood_timeline(self.timeline_canvas_frame)
+        if chart in self._pending_charts:
+            return
+        self._pending_charts.add(chart)
+        self.root.after_idle(self._refresh_chart, chart)
 
-        if chart_widget:
-            chart_widget.pack(fill=tk.BOTH, expand=True)
-        else:
-            label = tk.Label(self.timeline_canvas_frame,
-                             text="No mood scores available. Click 'Analyze Dreams' first!",
-                             font=("Arial", 11), fg="#666")
-            label.pack(expand=True)
+    def _refresh_chart(self, chart):
+        """Rebuilds a chart tab, skipping the rebuild if its data has not changed."""
+        self._pending_charts.discard(chart)
 
-    def refresh_distribution(self):
-        """Refresh the mood distribution chart using visualizer.py."""
-        if not VISUALIZER_AVAILABLE or not self.visualizer:
+        data_label = self._chart_label()
+        if self._chart_labels.get(chart) == data_label:
             return
+        self._chart_labels[chart] = data_label
 
-        # Clear previous canvas
-        for widget in self.dist_canvas_frame.winfo_children():
-            widget.destroy()
+        # Create the visualizer before the worker needs it. matplotlib itself is
+        # imported later, on this thread, by the first chart builder.
+        self._get_visualizer()
 
-        if not self.journal.dreams:
-            label = tk.Label(self.dist_canvas_frame,
-                             text="No dreams to visualize. Add some dreams first!",
-                             font=("Arial", 11), fg="#666")
-            label.pack(expand=True)
+        prepare = self._charts[chart][1]
+        if prepare is not None and self.journal.dreams:
+            # Extract the data off the Tk thread; only drawing happens on it
+            threading.Thread(target=self._prepare_chart,
+                             args=(chart, data_label, prepare), daemon=True).start()
+        else:
+            self._show_chart(chart, data_label, None)
+
+    def _prepare_chart(self, chart, data_label, prepare):
+        """Worker thread: runs a chart's data step and hands the result to the Tk thread."""
+        try:
+            data = prepare()
+        except Exception as e:
+            print(f"Error preparing chart data: {e}")
+            data = None
+        self.root.after(0, self._show_chart, chart, data_label, data)
+
+    def _show_chart(self, chart, data_label, data):
+        """Draws (or updates) a chart tab from prepared data (main thread only)."""
+        # Dropped if a newer refresh of this chart started in the meantime
+        if self._chart_labels.get(chart) != data_label:
             return
 
-        # Use visualizer to create chart
-        chart_widget = self.visualizer.create_mood_distribution(self.dist_canvas_frame)
+        frame, _, create_chart, empty_message = self._charts[chart]
+        placeholder = self._chart_placeholders[chart]
+
+        # Use visualizer to create (or update) the chart. Its canvas is kept
+        # between refreshes, since the visualizer updates it in place.
+        chart_widget = create_chart(frame, data) if self.journal.dreams else None
 
         if chart_widget:
+            placeholder.pack_forget()
+            self._chart_widgets[chart] = chart_widget
             chart_widget.pack(fill=tk.BOTH, expand=True)
-        else:
-            label = tk.Label(self.dist_canvas_frame,
-                             text="No mood scores available. Click 'Analyze Dreams' first!",
-                             font=("Arial", 11), fg="#666")
-            label.pack(expand=True)
-
-    def refresh_themes(self):
-        """Refresh the top themes chart using visualizer.py."""
-        if not VISUALIZER_AVAILABLE or not self.visualizer:
             return
 
-        # Clear previous canvas
-        for widget in self.themes_canvas_frame.winfo_children():
-            widget.destroy()
+        canvas_widget = self._chart_widgets.get(chart)
+        if canvas_widget is not None:
+            canvas_widget.pack_forget()
 
         if not self.journal.dreams:
-            label = tk.Label(self.themes_canvas_frame,
-                             text="No dreams to visualize. Add some dreams first!",
-                             font=("Arial", 11), fg="#666")
-            label.pack(expand=True)
-            return
-
-        # Use visualizer to create chart
-        chart_widget = self.visualizer.create_themes_chart(self.themes_canvas_frame)
+            empty_message = "No dreams to visualize. Add some dreams first!"
+        placeholder.config(text=empty_message)
+        placeholder.pack(expand=True)
 
-        if chart_widget:
-            chart_widget.pack(fill=tk.BOTH, expand=True)
-        else:
-            label = tk.Label(self.themes_canvas_frame,
-                             text="No themes to visualize.",
-                             font=("Arial", 11), fg="#666")
-            label.pack(expand=True)
+    def _chart_label(self):
+        """Fingerprint of everything the charts depend on, including how many dreams are scored."""
+        return self._data_label() + (sum(self._mood_hist),)
 
     def view_dreams(self):
         """Display all recorded dreams."""
@@ -392,20 +585,24 @@ class DreamUI:
         tk.Label(frame, text="📖 Your Dream Journal",
                  font=("Arial", 14, "bold")).pack(pady=(0, 10))
 
-        text_widget = tk.Text(frame, wrap=tk.WORD, font=("Arial", 10))
+        text_widget = tk.Text(frame, wrap=tk.WORD, font=("Arial", 10),
+                              undo=False, autoseparators=False, maxundo=0)
         scrollbar = tk.Scrollbar(frame, command=text_widget.yview)
         text_widget.config(yscrollcommand=scrollbar.set)
 
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Display dreams
+        # Display dreams, newest first, with a single insert into the widget
+        total = len(self.journal.dreams)
+        lines = []
         for i, dream in enumerate(reversed(self.journal.dreams), 1):
             mood_str = f" [Mood: {dream.mood_score:.2f}]" if dream.mood_score is not None else ""
-            text_widget.insert(tk.END, f"\n{'=' * 60}\n")
-            text_widget.insert(tk.END, f"Dream #{len(self.journal.dreams) - i + 1} - {dream.date}{mood_str}\n")
-            text_widget.insert(tk.END, f"{'=' * 60}\n")
-            text_widget.insert(tk.END, f"{dream.text}\n")
+            lines.append(f"\n{_SEP}\n"
+                         f"Dream #{total - i + 1} - {dream.date}{mood_str}\n"
+                         f"{_SEP}\n"
+                         f"{dream.text}\n")
+        text_widget.insert(tk.END, "".join(lines))
 
         text_widget.config(state=tk.DISABLED)
 
@@ -427,32 +624,50 @@ class DreamUI:
         tk.Label(frame, text="Select a dream to delete:",
                  font=("Arial", 12, "bold")).pack(pady=(0, 10))
 
-        # Create listbox with scrollbar
+        # Create dream list with scrollbar
         list_frame = tk.Frame(frame)
         list_frame.pack(fill=tk.BOTH, expand=True)
 
         scrollbar = tk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        dream_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set,
-                                   font=("Arial", 9), selectmode=tk.SINGLE)
-        dream_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=dream_listbox.yview)
-
-        # Populate listbox
-        for i, dream in enumerate(self.journal.dreams, 1):
-            preview = dream.text[:50] + "..." if len(dream.text) > 50 else dream.text
-            dream_listbox.insert(tk.END, f"{i}. [{dream.date}] {preview}")
+        ttk.Style(delete_window).configure("DreamList.Treeview", font=("Arial", 9))
+        dream_list = ttk.Treeview(list_frame, show="tree", selectmode="browse",
+                                  style="DreamList.Treeview")
+        dream_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=dream_list.yview)
+
+        # Rows are inserted in chunks, the next one when the list is scrolled
+        # to the bottom, so a large journal doesn't build every row up front
+        dreams = self.journal.dreams
+        loaded = 0
+
+        def load_rows():
+            nonlocal loaded
+            end = min(loaded + _ROW_CHUNK, len(dreams))
+            for i in range(loaded, end):
+                dream = dreams[i]
+                dream_list.insert("", tk.END, iid=str(i),
+                                  text=f"{i + 1}. [{dream.date}] {dream.get_preview()}")
+            loaded = end
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 1.0 and loaded < len(dreams):
+                load_rows()
+
+        dream_list.config(yscrollcommand=on_scroll)
+        load_rows()
 
         def confirm_delete():
-            selection = dream_listbox.curselection()
+            selection = dream_list.selection()
             if not selection:
                 messagebox.showwarning("No Selection", "Please select a dream to delete.")
                 return
 
-            index = selection[0]
+            index = int(selection[0])
             dream = self.journal.dreams[index]
-            preview = dream.text[:50] + "..." if len(dream.text) > 50 else dream.text
+            preview = dream.get_preview()
 
             if messagebox.askyesno("Confirm Delete",
                                    f"Are you sure you want to delete this dream?\n\n"
@@ -460,10 +675,11 @@ class DreamUI:
                                    f"Preview: {preview}"):
                 deleted = self.journal.delete_dream(index)
                 if deleted:
+                    self._forget_dream(deleted)
                     messagebox.showinfo("Success", "Dream deleted successfully!")
                     delete_window.destroy()
                     # Refresh analysis if displayed
-                    if self.output_text.get("1.0", tk.END).strip().startswith("📊"):
+                    if self._analysis_shown:
                         self.show_analysis()
                 else:
                     messagebox.showerror("Error", "Failed to delete dream.")
@@ -494,16 +710,20 @@ class DreamUI:
         )
 
         if response:  # User clicked Yes
-            self.journal.dreams.clear()
-            self.journal.save_dreams()
+            self.journal.delete_all_dreams()
+            if self._theme_counter is not None:
+                self._theme_counter.clear()
+            self._mood_hist = [0] * 5
             messagebox.showinfo("Success", f"All {count} dreams have been deleted.")
 
             # Clear analysis display
-            self.output_text.config(state=tk.NORMAL)
-            self.output_text.delete("1.0", tk.END)
-            self.output_text.insert("1.0", "All dreams deleted. 🗑️\n\n"
-                                           "Start recording new dreams to see analysis here.")
-            self.output_text.config(state=tk.DISABLED)
+            self._show_output("All dreams deleted. 🗑️\n\n"
+                              "Start recording new dreams to see analysis here.")
 
     def run(self):
-        self.root.mainloop()
\ No newline at end of file
+        try:
+            self.root.mainloop()
+        finally:
+            # Free the chart figures once the window is gone
+            if self.visualizer is not None:
+                self.visualizer.close()
\ No newline at end of file
@@ -4,55 +4,141 @@ Visualization module for Dream Journal Analyzer.
 Creates embedded matplotlib charts for Tkinter integration.
 """
 
-try:
-    import matplotlib
+import importlib.util
 
-    matplotlib.use('TkAgg')
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import matplotlib.dates as mdates
-    from datetime import datetime
-    from collections import Counter
+from analyzer import count_moods, count_theme_words, theme_words
 
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# matplotlib is found without importing it; the import itself (font cache,
+# TkAgg backend) is deferred to _ensure_mpl() on the first chart request
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+_MPL_LOADED = False
+
+# Words left out of the themes chart (tokenized by analyzer.theme_words,
+# which already skips contractions)
+_STOP = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'was', 'were', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
+    'can', 'am', 'is', 'are', 'i', 'me', 'my', 'you', 'your', 'it', 'its'
+})
+
+# Mood categories, ordered as displayed
+_MOOD_CATEGORIES = ('Very Positive', 'Positive', 'Neutral', 'Negative', 'Very Negative')
+
+
+def _ensure_mpl():
+    """
+    Imports matplotlib and selects the TkAgg backend on first use.
+
+    Returns:
+        True if matplotlib is ready, False if it is not installed or failed to import
+    """
+    global matplotlib, FigureCanvasTkAgg, Figure, _BLUES, MATPLOTLIB_AVAILABLE, _MPL_LOADED
+    if _MPL_LOADED or not MATPLOTLIB_AVAILABLE:
+        return MATPLOTLIB_AVAILABLE
+
+    try:
+        import matplotlib
+
+        matplotlib.use('TkAgg')
+        # Let Agg drop near-collinear vertices and render long lines in chunks
+        matplotlib.rcParams.update({
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+        })
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        import matplotlib.dates
+
+        # Looked up once; the themes chart samples it for every bar
+        _BLUES = matplotlib.colormaps['Blues']
+    except ImportError:
+        MATPLOTLIB_AVAILABLE = False
+        return False
+
+    _MPL_LOADED = True
+    return True
 
 
 class DreamVisualizer:
     """Handles creation of embedded visualizations for dream data."""
 
-    def __init__(self, journal):
+    def __init__(self, journal, dpi=100, scale=1.0):
         self.journal = journal
+        # For newly built figures: dpi sets the size of text and lines relative
+        # to the canvas (the Tk frame decides how many pixels are rendered), and
+        # scale multiplies the size the canvas requests before Tk lays it out
+        self.dpi = dpi
+        self.scale = scale
+        # Chart name -> live figure state (canvas, axes, artists) reused across refreshes
+        self._charts = {}
 
     @staticmethod
     def is_available():
-        """Check if matplotlib is available."""
+        """Check if matplotlib is available (without importing it)."""
         return MATPLOTLIB_AVAILABLE
 
-    def create_mood_timeline(self, parent_frame):
+    @staticmethod
+    def theme_words(dream):
+        """Returns the words a dream contributes to the themes chart."""
+        return theme_words(dream, _STOP)
+
+    def _reusable_chart(self, name, parent_frame):
         """
-        Creates an embedded mood timeline chart in the given Tkinter frame.
+        Returns the live state of a chart already embedded in parent_frame, or None.
+        The state's 'key' holds the data the chart currently shows, so callers
+        can return the widget untouched when nothing changed.
+        """
+        chart = self._charts.get(name)
+        if chart is None:
+            return None
+        widget = chart['canvas'].get_tk_widget()
+        if widget.master is not parent_frame or not widget.winfo_exists():
+            return None
+        return chart
 
-        Args:
-            parent_frame: Tkinter frame to embed the chart in
+    def _evict(self, name):
+        """
+        Drops a chart's live state, destroying its canvas widget and clearing
+        its figure so the renderer and artists can be freed right away.
+        """
+        chart = self._charts.pop(name, None)
+        if chart is None:
+            return
+
+        canvas = chart['canvas']
+        try:
+            canvas.get_tk_widget().destroy()
+        except Exception:
+            pass  # already destroyed along with its parent window
+        canvas.figure.clf()
+
+    def close(self):
+        """Releases every chart figure; call when the window is closed."""
+        for name in list(self._charts):
+            self._evict(name)
+
+    def prepare_timeline_data(self):
+        """
+        Extracts the timeline's (dates, scores) from the journal, sorted by date.
+        Touches no matplotlib or Tk state, so it can run on a worker thread.
 
         Returns:
-            Canvas widget if successful, None otherwise
+            Tuple of (dates, scores) tuples, or None if no dream has a mood score
         """
-        if not MATPLOTLIB_AVAILABLE:
-            return None
-
-        # Extract dates and mood scores
+        # Extract dates and mood scores (from a snapshot of the list, since
+        # the UI thread may add or delete dreams meanwhile)
         dates = []
         scores = []
 
-        for dream in self.journal.dreams:
-            if dream.mood_score is not None:
+        for dream in list(self.journal.dreams):
+            score = dream.mood_score
+            if score is not None:
                 try:
-                    date_obj = datetime.strptime(dream.date, "%Y-%m-%d")
+                    date_obj = dream.get_date_obj()  # parsed once per dream
                     dates.append(date_obj)
-                    scores.append(dream.mood_score)
+                    scores.append(score)
                 except ValueError:
                     continue
 
@@ -62,16 +148,72 @@ class DreamVisualizer:
         # Sort by date to ensure proper timeline
         sorted_data = sorted(zip(dates, scores))
         dates, scores = zip(*sorted_data)
+        return dates, scores
+
+    def create_mood_timeline(self, parent_frame, data=None):
+        """
+        Creates an embedded mood timeline chart in the given Tkinter frame.
+        If the chart already exists in that frame, its line data is updated
+        in place instead of building a new figure, and only the line is
+        re-blitted when the date range has not changed.
+
+        Args:
+            parent_frame: Tkinter frame to embed the chart in
+            data: Optional result of prepare_timeline_data(); extracted from
+                  the journal when omitted
+
+        Returns:
+            Canvas widget if successful, None otherwise
+        """
+        if not _ensure_mpl():
+            return None
 
-        # Create figure
-        fig = Figure(figsize=(8, 5), dpi=100)
+        if data is None:
+            data = self.prepare_timeline_data()
+        if data is None:
+            return None
+        dates, scores = data
+
+        chart = self._reusable_chart('timeline', parent_frame)
+        if chart is not None:
+            if chart['key'] != data:
+                self.update_timeline(dates, scores)
+            return chart['canvas'].get_tk_widget()
+
+        # Create figure (replacing any chart left in another frame)
+        self._evict('timeline')
+        fig = Figure(figsize=(8 * self.scale, 5 * self.scale), dpi=self.dpi)
         ax = fig.add_subplot(111)
+        line = self._plot_timeline(ax, dates, scores, animated=True)
+
+        # Rotate date labels for better readability
+        fig.autofmt_xdate(rotation=30, ha='right')
+
+        # Add padding and tight layout
+        fig.tight_layout(pad=2.0)
 
+        # Embed in Tkinter. The line is animated (left out of normal draws) so
+        # the rest of the axes can be cached as a background for blitting.
+        canvas = FigureCanvasTkAgg(fig, master=parent_frame)
+        self._charts['timeline'] = {'canvas': canvas, 'ax': ax, 'line': line,
+                                    'background': None, 'key': data}
+        canvas.mpl_connect('draw_event', self._on_timeline_draw)
+        canvas.draw_idle()
+
+        return canvas.get_tk_widget()
+
+    def _plot_timeline(self, ax, dates, scores, animated=False):
+        """
+        Draws the mood timeline onto ax.
+
+        Returns:
+            The mood score Line2D
+        """
         # Plot mood timeline with dotted line
-        ax.plot(dates, scores, marker='o', linewidth=2.5,
-                markersize=10, color='#2196F3', label='Mood Score',
-                markeredgecolor='white', markeredgewidth=2, alpha=0.9,
-                dash_capstyle='round')
+        line, = ax.plot(dates, scores, marker='o', linewidth=2.5,
+                        markersize=10, color='#2196F3', label='Mood Score',
+                        markeredgecolor='white', markeredgewidth=2, alpha=0.9,
+                        dash_capstyle='round', animated=animated)
 
         # Add horizontal reference lines with better styling
         ax.axhline(y=0.5, color='#4CAF50', linestyle='--', alpha=0.5, linewidth=1.5,
@@ -98,135 +240,214 @@ class DreamVisualizer:
 
         # Format dates on x-axis
         ax.xaxis.set_major_formatter(matplotlib.dates.DateFormatter('%Y-%m-%d'))
+        return line
 
-        # Rotate date labels for better readability
-        fig.autofmt_xdate(rotation=30, ha='right')
-
-        # Add padding and tight layout
-        fig.tight_layout(pad=2.0)
-
-        # Embed in Tkinter
-        canvas = FigureCanvasTkAgg(fig, master=parent_frame)
-        canvas.draw()
+    def update_timeline(self, dates, scores):
+        """
+        Updates the existing timeline chart in place with new data. Only the
+        line is re-blitted over the cached background when the date range is
+        unchanged; otherwise the canvas is redrawn on the next idle tick.
 
-        return canvas.get_tk_widget()
+        Args:
+            dates: Sorted sequence of datetimes
+            scores: Mood scores matching dates
 
-    def create_mood_distribution(self, parent_frame):
+        Returns:
+            True if a timeline chart was updated, False if none exists yet
+        """
+        chart = self._charts.get('timeline')
+        if chart is None:
+            return False
+
+        canvas, ax, line = chart['canvas'], chart['ax'], chart['line']
+        chart['key'] = (tuple(dates), tuple(scores))
+
+        old_xlim = ax.get_xlim()
+        line.set_data(dates, scores)
+        ax.relim()
+        ax.autoscale_view()
+
+        if ax.get_xlim() == old_xlim and chart['background'] is not None:
+            # Axes, grid and ticks are unchanged: blit just the line
+            canvas.restore_region(chart['background'])
+            ax.draw_artist(line)
+            canvas.blit(ax.bbox)
+        else:
+            # Full redraw; _on_timeline_draw re-captures the background
+            canvas.draw_idle()
+        return True
+
+    def _on_timeline_draw(self, event):
+        """Caches the timeline background after every full draw (including resizes)."""
+        chart = self._charts.get('timeline')
+        if chart is None or event.canvas is not chart['canvas']:
+            return
+        ax = chart['ax']
+        chart['background'] = event.canvas.copy_from_bbox(ax.bbox)
+        ax.draw_artist(chart['line'])
+
+    def create_mood_distribution(self, parent_frame, counts=None):
         """
         Creates an embedded mood distribution bar chart in the given Tkinter frame.
+        If the chart already exists in that frame, the bar heights and labels
+        are updated in place instead of building a new figure.
 
         Args:
             parent_frame: Tkinter frame to embed the chart in
+            counts: Optional dream counts per mood category, ordered Very Positive
+                    to Very Negative; counted from the journal when omitted
 
         Returns:
             Canvas widget if successful, None otherwise
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return None
 
         # Count dreams in each category
-        categories = {
-            'Very Positive': 0,
-            'Positive': 0,
-            'Neutral': 0,
-            'Negative': 0,
-            'Very Negative': 0
-        }
-
-        for dream in self.journal.dreams:
-            if dream.mood_score is not None:
-                score = dream.mood_score
-                if score >= 0.5:
-                    categories['Very Positive'] += 1
-                elif score >= 0.1:
-                    categories['Positive'] += 1
-                elif score >= -0.1:
-                    categories['Neutral'] += 1
-                elif score >= -0.5:
-                    categories['Negative'] += 1
-                else:
-                    categories['Very Negative'] += 1
-
-        # Create figure
-        fig = Figure(figsize=(8, 5), dpi=100)
+        if counts is not None:
+            categories = dict(zip(_MOOD_CATEGORIES, counts))
+        else:
+            categories = self._mood_counts()
+
+        key = tuple(categories.values())
+        chart = self._reusable_chart('distribution', parent_frame)
+        if chart is not None:
+            if chart['key'] == key:
+                return chart['canvas'].get_tk_widget()
+            chart['key'] = key
+
+            for bar, label, height in zip(chart['bars'], chart['labels'], categories.values()):
+                bar.set_height(height)
+                label.set_y(height)
+                label.set_text(f'{int(height)}')
+                label.set_visible(height > 0)
+            chart['ax'].relim()
+            chart['ax'].autoscale_view()
+            chart['canvas'].draw_idle()
+            return chart['canvas'].get_tk_widget()
+
+        # Create figure (replacing any chart left in another frame)
+        self._evict('distribution')
+        fig = Figure(figsize=(8 * self.scale, 5 * self.scale), dpi=self.dpi)
         ax = fig.add_subplot(111)
+        bars, labels = self._plot_distribution(ax, categories)
+
+        fig.tight_layout()
 
+        # Embed in Tkinter
+        canvas = FigureCanvasTkAgg(fig, master=parent_frame)
+        canvas.draw_idle()
+
+        self._charts['distribution'] = {'canvas': canvas, 'ax': ax, 'bars': bars, 'labels': labels,
+                                        'key': key}
+        return canvas.get_tk_widget()
+
+    def _plot_distribution(self, ax, categories):
+        """
+        Draws the mood distribution bars onto ax.
+
+        Args:
+            ax: Axes to draw on
+            categories: Dictionary of category name -> dream count
+
+        Returns:
+            Tuple of (bars, value labels)
+        """
         colors = ['#4CAF50', '#8BC34A', '#FFC107', '#FF9800', '#F44336']
         bars = ax.bar(categories.keys(), categories.values(), color=colors, alpha=0.8)
 
-        # Add value labels on bars
+        # Add value labels on bars (kept, hidden when zero, so refreshes can update them)
+        labels = []
         for bar in bars:
             height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width() / 2., height,
-                        f'{int(height)}',
-                        ha='center', va='bottom', fontweight='bold')
+            label = ax.text(bar.get_x() + bar.get_width() / 2., height,
+                            f'{int(height)}',
+                            ha='center', va='bottom', fontweight='bold')
+            label.set_visible(height > 0)
+            labels.append(label)
 
         # Styling
         ax.set_xlabel('Mood Category', fontsize=10, fontweight='bold')
         ax.set_ylabel('Number of Dreams', fontsize=10, fontweight='bold')
         ax.set_title('Dream Mood Distribution', fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
+        # Category axis, not dates: rotate the labels directly
+        self._slant_xticklabels(ax)
+        return bars, labels
 
-        fig.autofmt_xdate()
-        fig.tight_layout()
-
-        # Embed in Tkinter
-        canvas = FigureCanvasTkAgg(fig, master=parent_frame)
-        canvas.draw()
-
-        return canvas.get_tk_widget()
-
-    def create_themes_chart(self, parent_frame, top_n=15):
+    def create_themes_chart(self, parent_frame, top_n=15, word_counts=None):
         """
         Creates an embedded top themes horizontal bar chart in the given Tkinter frame.
+        If the chart already exists in that frame, its axes are redrawn on the
+        existing figure and canvas.
 
         Args:
             parent_frame: Tkinter frame to embed the chart in
             top_n: Number of top themes to display
+            word_counts: Optional Counter of theme words across the journal;
+                         extracted from the dream texts when omitted
 
         Returns:
             Canvas widget if successful, None otherwise
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return None
 
-        # Extract all words
-        all_words = []
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'was', 'were', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
-            'can', 'am', 'is', 'are', 'i', 'me', 'my', 'you', 'your', 'it', 'its'
-        }
-
-        for dream in self.journal.dreams:
-            words = dream.text.lower().split()
-            filtered = [w.strip('.,!?;:()[]{}""\'') for w in words
-                        if w.isalpha() and len(w) > 2 and w not in stop_words]
-            all_words.extend(filtered)
+        if word_counts is None:
+            word_counts = self.theme_counts()
 
-        if not all_words:
+        if not word_counts:
             return None
 
         # Get top themes
-        word_counts = Counter(all_words)
         top_themes = word_counts.most_common(top_n)
 
-        themes = [theme for theme, count in reversed(top_themes)]
-        counts = [count for theme, count in reversed(top_themes)]
+        key = (top_n, tuple(top_themes))
+        chart = self._reusable_chart('themes', parent_frame)
+        if chart is not None:
+            if chart['key'] == key:
+                return chart['canvas'].get_tk_widget()
+            chart['key'] = key
+
+            fig, ax = chart['canvas'].figure, chart['ax']
+            ax.clear()
+        else:
+            # Create figure (replacing any chart left in another frame)
+            self._evict('themes')
+            fig = Figure(figsize=(8 * self.scale, 6 * self.scale), dpi=self.dpi)
+            ax = fig.add_subplot(111)
+
+        self._plot_themes(ax, top_themes, top_n)
+        fig.tight_layout()
 
-        # Create figure
-        fig = Figure(figsize=(8, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        if chart is not None:
+            chart['canvas'].draw_idle()
+            return chart['canvas'].get_tk_widget()
 
-        bars = ax.barh(themes, counts, color='#2196F3', alpha=0.7)
+        # Embed in Tkinter
+        canvas = FigureCanvasTkAgg(fig, master=parent_frame)
+        canvas.draw_idle()
+
+        self._charts['themes'] = {'canvas': canvas, 'ax': ax, 'key': key}
+        return canvas.get_tk_widget()
+
+    def _plot_themes(self, ax, top_themes, top_n):
+        """
+        Draws the top themes as horizontal bars onto ax, most frequent on top.
+
+        Args:
+            ax: Axes to draw on
+            top_themes: (theme, count) pairs, most frequent first
+            top_n: Number of themes requested, for the title
+        """
+        themes = [theme for theme, count in reversed(top_themes)]
+        counts = [count for theme, count in reversed(top_themes)]
 
-        # Color bars based on frequency (gradient effect)
+        # Color bars based on frequency (gradient effect), sampling the
+        # colormap once for all bars
         max_count = max(counts) if counts else 1
-        for i, bar in enumerate(bars):
-            intensity = counts[i] / max_count
-            bar.set_color(matplotlib.cm.Blues(0.4 + intensity * 0.6))
+        colors = _BLUES([0.4 + 0.6 * count / max_count for count in counts])
+        ax.barh(themes, counts, color=colors, edgecolor=colors, alpha=0.7)
 
         # Styling
         ax.set_xlabel('Frequency', fontsize=10, fontweight='bold')
@@ -234,14 +455,82 @@ class DreamVisualizer:
         ax.set_title(f'Top {top_n} Recurring Dream Themes', fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='x')
 
-        fig.tight_layout()
+    def create_dashboard(self, parent_frame, top_n=15):
+        """
+        Creates all three charts as subplots of one figure in the given Tkinter
+        frame, so they share a single renderer and canvas and draw in one pass.
+
+        Args:
+            parent_frame: Tkinter frame to embed the dashboard in
+            top_n: Number of top themes to display
+
+        Returns:
+            Canvas widget if successful, None otherwise
+        """
+        if not _ensure_mpl():
+            return None
+
+        self._evict('dashboard')
+        fig = Figure(figsize=(8 * self.scale, 12 * self.scale), dpi=self.dpi)
+        ax_timeline, ax_distribution, ax_themes = fig.subplots(3, 1)
+
+        data = self.prepare_timeline_data()
+        if data is not None:
+            self._plot_timeline(ax_timeline, *data)
+            # autofmt_xdate would hide the x labels of every row but the last
+            self._slant_xticklabels(ax_timeline)
+        else:
+            self._plot_placeholder(ax_timeline, 'No mood data yet. Run an analysis first.')
+
+        self._plot_distribution(ax_distribution, self._mood_counts())
+
+        word_counts = self.theme_counts()
+        if word_counts:
+            self._plot_themes(ax_themes, word_counts.most_common(top_n), top_n)
+        else:
+            self._plot_placeholder(ax_themes, 'No themes found yet.')
+
+        fig.tight_layout(pad=2.0)
 
         # Embed in Tkinter
         canvas = FigureCanvasTkAgg(fig, master=parent_frame)
-        canvas.draw()
+        canvas.draw_idle()
 
+        self._charts['dashboard'] = {'canvas': canvas, 'key': None}
         return canvas.get_tk_widget()
 
+    @staticmethod
+    def _slant_xticklabels(ax):
+        """Rotates ax's x tick labels by 30 degrees, right-aligned to their ticks like autofmt_xdate."""
+        for label in ax.get_xticklabels():
+            label.set_rotation(30)
+            label.set_ha('right')
+
+    @staticmethod
+    def _plot_placeholder(ax, message):
+        """Shows a centered message in place of an empty chart."""
+        ax.text(0.5, 0.5, message, ha='center', va='center', transform=ax.transAxes)
+        ax.set_axis_off()
+
+    def theme_counts(self):
+        """
+        Counts theme words (see theme_words) across the journal, with the
+        analyzer's compiled word counter on large journals.
+
+        Returns:
+            Counter of theme word -> occurrences
+        """
+        return count_theme_words(list(self.journal.dreams), _STOP)
+
+    def _mood_counts(self):
+        """
+        Counts scored dreams per mood category.
+
+        Returns:
+            Dictionary of category name -> dream count, Very Positive first
+        """
+        return dict(zip(_MOOD_CATEGORIES, count_moods(self.journal.dreams)))
+
     def get_statistics_summary(self):
         """
         Returns a dictionary of visualization statistics.
@@ -252,31 +541,17 @@ class DreamVisualizer:
         if not self.journal.dreams:
             return None
 
-        # Count mood categories
-        mood_counts = {
-            'Very Positive': 0,
-            'Positive': 0,
-            'Neutral': 0,
-            'Negative': 0,
-            'Very Negative': 0
-        }
+        # Stops at the first scored dream; with none there is nothing to count
+        has_mood_scores = any(d.mood_score is not None for d in self.journal.dreams)
 
-        for dream in self.journal.dreams:
-            if dream.mood_score is not None:
-                score = dream.mood_score
-                if score >= 0.5:
-                    mood_counts['Very Positive'] += 1
-                elif score >= 0.1:
-                    mood_counts['Positive'] += 1
-                elif score >= -0.1:
-                    mood_counts['Neutral'] += 1
-                elif score >= -0.5:
-                    mood_counts['Negative'] += 1
-                else:
-                    mood_counts['Very Negative'] += 1
+        # Count mood categories
+        if has_mood_scores:
+            mood_counts = self._mood_counts()
+        else:
+            mood_counts = dict.fromkeys(_MOOD_CATEGORIES, 0)
 
         return {
             'total_dreams': len(self.journal.dreams),
             'mood_distribution': mood_counts,
-            'has_mood_scores': any(d.mood_score is not None for d in self.journal.dreams)
+            'has_mood_scores': has_mood_scores
         }